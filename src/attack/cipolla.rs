@@ -63,8 +63,8 @@ impl CustomComplexNumber {
 }
 
 fn is_residue(x: &Integer, modulus: &Integer) -> bool {
-    let power = Integer::from(modulus - 1) >> 1;
-    *x != 0 && Integer::from(x.pow_mod_ref(&power, modulus).unwrap()) == 1
+    // Legendre symbol instead of Euler's criterion, no modular exponentiation needed
+    *x != 0 && x.legendre(modulus) == 1
 }
 
 // Returns two solutions (x1, x2) for Quadratic Residue problem x^2 = a (mod p), where p is an odd prime
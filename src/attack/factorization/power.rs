@@ -24,6 +24,11 @@ impl Attack for PowerAttack {
         let e = &params.e;
         let n = params.n.as_ref().ok_or(Error::MissingParameters)?;
 
+        // Reject most moduli with a single check instead of trying every root
+        if !n.is_perfect_power() {
+            return Err(Error::NotFound);
+        }
+
         for power in (2..log_base_ceil(n, 2) as u32).rev() {
             let (root, rem) = n.root_rem_ref(power).into();
 
@@ -46,6 +51,8 @@ impl Attack for PowerAttack {
 mod tests {
     use std::str::FromStr;
 
+    use rug::ops::Pow;
+
     use crate::{Attack, Factors, Parameters};
 
     use super::*;
@@ -83,4 +90,29 @@ mod tests {
 
         assert_eq!(pk.factors, factors);
     }
+
+    #[test]
+    fn not_a_power() {
+        // Same outcome as scanning every root, only rejected earlier
+        let params = Parameters {
+            n: Some(Integer::from(2) * Integer::from(3).pow(16)),
+            ..Default::default()
+        };
+
+        assert_eq!(PowerAttack.run(&params, None).unwrap_err(), Error::NotFound);
+    }
+
+    #[test]
+    fn composite_root() {
+        // A perfect power must get past the early check and reach the root scan
+        let params = Parameters {
+            n: Some(Integer::from(6).pow(16)),
+            ..Default::default()
+        };
+
+        assert_eq!(
+            PowerAttack.run(&params, None).unwrap_err(),
+            Error::PartialFactorization(Factors::from(HashMap::from([(Integer::from(6), 16)])))
+        );
+    }
 }
@@ -33,12 +33,11 @@ impl Attack for SmallPrimeAttack {
                 break;
             }
 
-            let prime = Integer::from(prime);
-            if tmp_n.clone().div_rem(prime.clone()).1 == 0 {
-                while tmp_n.clone().div_rem(prime.clone()).1 == 0 {
-                    tmp_n /= &prime;
-                    *factors.entry(prime.clone()).or_insert(0) += 1;
-                }
+            // The first million primes fit in a u32, divide by machine words
+            let prime = prime as u32;
+            while tmp_n.is_divisible_u(prime) {
+                tmp_n /= prime;
+                *factors.entry(Integer::from(prime)).or_insert(0) += 1;
             }
 
             if i % TICK_SIZE as usize == 0 {
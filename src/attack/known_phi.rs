@@ -1,24 +1,14 @@
 use indicatif::ProgressBar;
 use rug::{integer::IsPrime, ops::Pow, rand::RandState, Integer};
 
-use crate::{key::PrivateKey, Attack, AttackKind, AttackSpeed, Error, Parameters, Solution};
+use crate::{
+    key::PrivateKey, ntheory::trivial_factorization_with_n_phi, Attack, AttackKind, AttackSpeed,
+    Error, Parameters, Solution,
+};
 
 /// See https://github.com/jvdsn/crypto-attacks/blob/master/attacks/factorization/known_phi.py
 pub fn factorize(n: &Integer, phi: &Integer) -> Option<(Integer, Integer)> {
-    let s = Integer::from(1) + n - phi;
-    let d = s.clone().pow(2) - n * Integer::from(4);
-    let sqrt_d = if d > 0 && d.is_perfect_square() {
-        d.sqrt()
-    } else {
-        return None;
-    };
-    let p: Integer = (s.clone() - &sqrt_d) >> 1;
-    let q: Integer = (s + sqrt_d) >> 1;
-
-    // Check if p and q are factors of n
-    if p.clone() * q.clone() != *n {
-        return None;
-    }
+    let (p, q) = trivial_factorization_with_n_phi(n, phi)?;
 
     // Check if p and q are prime
     if p.is_probably_prime(100) == IsPrime::No || q.is_probably_prime(100) == IsPrime::No {
@@ -55,7 +55,7 @@ impl Attack for NonCoprimeExpAttack {
             }
 
             // Finding possible plaintexts (Algorithm 2).
-            let d = e.clone().invert(&phi).unwrap();
+            let d = e.clone().invert(&phi).or(Err(Error::NotFound))?;
             let a = c.clone().pow_mod(&d, n).unwrap();
             let mut l = ge.clone();
             let mut ms = Vec::new();
@@ -88,21 +88,18 @@ impl Attack for NonCoprimeExpAttack {
             }
 
             // Compute e-th roots mod p and q
+            // Note: a composite e can share a factor with p - 1 without dividing it
             let mps = if tp == 0 {
-                vec![cp
-                    .clone()
-                    .pow_mod(&e.clone().invert(&pm1).unwrap(), &p)
-                    .unwrap()]
+                let dp = e.clone().invert(&pm1).or(Err(Error::NotFound))?;
+                vec![cp.clone().pow_mod(&dp, &p).unwrap()]
             } else {
                 // TODO: Compute: list(rth_roots(GF(p), cp, e)
                 Vec::new()
             };
             // Compute e-th roots mod p and q
             let mqs = if tq == 0 {
-                vec![cq
-                    .clone()
-                    .pow_mod(&e.clone().invert(&qm1).unwrap(), &q)
-                    .unwrap()]
+                let dq = e.clone().invert(&qm1).or(Err(Error::NotFound))?;
+                vec![cq.clone().pow_mod(&dq, &q).unwrap()]
             } else {
                 // TODO: Compute: list(rth_roots(GF(q), cq, e))
                 Vec::new()
@@ -185,4 +182,20 @@ mod tests {
         // assert_eq!(ms.len(), 97);
         // assert!(ms.iter().any(|m_| m_ == &m));
     }
+
+    #[test]
+    fn composite_exponent() {
+        // e = 9 shares the factor 3 with p - 1 = 6 but does not divide it
+        let factors = Factors::from([Integer::from(7), Integer::from(109)]);
+
+        let params = Parameters {
+            e: 9.into(),
+            n: Some(factors.product()),
+            phi: Some(factors.phi()),
+            c: Some(2.into()),
+            ..Default::default()
+        };
+
+        assert!(NonCoprimeExpAttack.run(&params, None).is_err());
+    }
 }
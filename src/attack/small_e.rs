@@ -1,10 +1,49 @@
 use indicatif::ProgressBar;
-use rug::Integer;
+use rug::{integer::IsPrime, Integer};
 
 use crate::{Attack, AttackKind, AttackSpeed, Error, Parameters, Solution};
 
 const MAX_ITERATIONS: u64 = 1_000_000;
 const TICK_SIZE: u64 = MAX_ITERATIONS / 100;
+const SIEVE_PRIMES: usize = 8;
+const SIEVE_MAX_PRIME: u64 = 1 << 16;
+
+fn pow_mod_u64(mut base: u64, mut exp: u32, modulus: u64) -> u64 {
+    let mut result = 1 % modulus;
+    base %= modulus;
+    while exp > 0 {
+        if exp & 1 == 1 {
+            result = result * base % modulus;
+        }
+        base = base * base % modulus;
+        exp >>= 1;
+    }
+    result
+}
+
+/// Small primes q = 1 mod e, with a table of the e-th power residues modulo q
+///
+/// Only about 1/e of the residues modulo such a q are e-th powers, so each prime
+/// rejects most candidates without computing any root.
+fn power_residue_sieve(e: u32) -> Vec<(u64, Vec<bool>)> {
+    let mut sieve = Vec::new();
+    if e < 2 {
+        return sieve;
+    }
+
+    let mut q = u64::from(e) + 1;
+    while q < SIEVE_MAX_PRIME && sieve.len() < SIEVE_PRIMES {
+        if Integer::from(q).is_probably_prime(30) != IsPrime::No {
+            let mut residues = vec![false; q as usize];
+            for x in 0..q {
+                residues[pow_mod_u64(x, e, q) as usize] = true;
+            }
+            sieve.push((q, residues));
+        }
+        q += u64::from(e);
+    }
+    sieve
+}
 
 /// Small e attack (m^e = c + k * n, with k small)
 #[derive(Debug, Clone, PartialEq, Eq)]
@@ -34,13 +73,28 @@ impl Attack for SmallEAttack {
         if let Some(pb) = pb {
             pb.set_length(MAX_ITERATIONS);
         }
-        for i in 1..MAX_ITERATIONS {
-            let enc = Integer::from(n) * Integer::from(i) + c.clone();
-            let (root, rem) = enc.root_rem_ref(e).into();
+        let sieve = power_residue_sieve(e)
+            .into_iter()
+            .map(|(q, residues)| {
+                let n_q = u64::from(n.mod_u(q as u32));
+                let c_q = u64::from(c.mod_u(q as u32));
+                (q, n_q, c_q, residues)
+            })
+            .collect::<Vec<_>>();
 
-            // If the root is perfect, we found the plaintext
-            if rem == Integer::ZERO {
-                return Ok(Solution::new_m(self.name(), root));
+        for i in 1..MAX_ITERATIONS {
+            // Only compute the root if i * n + c is an e-th power modulo every sieve prime
+            if sieve
+                .iter()
+                .all(|(q, n_q, c_q, residues)| residues[((i % q * n_q + c_q) % q) as usize])
+            {
+                let enc = Integer::from(n * i) + c;
+                let (root, rem) = enc.root_rem_ref(e).into();
+
+                // If the root is perfect, we found the plaintext
+                if rem == Integer::ZERO {
+                    return Ok(Solution::new_m(self.name(), root));
+                }
             }
 
             if i % TICK_SIZE == 0 {
@@ -63,6 +117,20 @@ mod tests {
 
     use super::*;
 
+    #[test]
+    fn sieve() {
+        let sieve = power_residue_sieve(3);
+
+        assert_eq!(sieve.len(), SIEVE_PRIMES);
+        for (q, residues) in sieve {
+            assert_eq!(q % 3, 1);
+            assert_eq!(
+                residues.iter().filter(|r| **r).count() as u64,
+                (q - 1) / 3 + 1
+            );
+        }
+    }
+
     #[test]
     fn attack() {
         let m = bytes_to_integer(b"Skyf0l!");
@@ -1,9 +1,9 @@
 use indicatif::ProgressBar;
-use rug::{ops::Pow, Integer};
+use rug::Integer;
 
 use crate::{
     key::PrivateKey,
-    ntheory::{contfrac_to_rational, rational_to_contfrac, trivial_factorization_with_n_phi},
+    ntheory::{rational_convergents, trivial_factorization_with_n_phi},
     Attack, AttackKind, Error, Parameters, Solution,
 };
 
@@ -26,38 +26,31 @@ impl Attack for WienerAttack {
         let e = &params.e;
         let n = params.n.as_ref().ok_or(Error::MissingParameters)?;
 
-        let frac = rational_to_contfrac(e, n);
         if let Some(pb) = pb {
-            pb.set_length(frac.len() as u64);
+            // Lamé's bound on the number of partial quotients of e / n
+            pb.set_length(u64::from(n.significant_bits()) * 3 / 2 + 2);
         }
-        let mut convergents = Vec::new();
-        for i in 0..frac.len() {
-            convergents.push(contfrac_to_rational(&frac[0..i]));
+        // Convergents are streamed so the first valid one ends the attack
+        for (k, d) in rational_convergents(e, n) {
             if let Some(pb) = pb {
                 pb.inc(1);
             }
-        }
-        for (k, d) in convergents {
-            if k != 0 {
-                let (phi, q) = (e.clone() * &d - Integer::from(1)).div_rem_floor(k);
-                if phi.is_even() && q == 0 {
-                    let s = Integer::from(1) + n - &phi;
-                    let discr = s.clone().pow(2) - n * Integer::from(4);
-                    let t = if discr > 0 && discr.is_perfect_square() {
-                        discr.sqrt()
-                    } else {
-                        Integer::ZERO
-                    };
-
-                    if (s + t).is_even() {
-                        if let Some((p, q)) = trivial_factorization_with_n_phi(n, &phi) {
-                            return Ok(Solution::new_pk(
-                                self.name(),
-                                PrivateKey::from_p_q(p, q, e.clone())?,
-                            ));
-                        }
-                    }
-                }
+
+            if k == 0 {
+                continue;
+            }
+
+            // phi = (e * d - 1) / k, quotient and remainder from one division
+            let (phi, r) = (Integer::from(e * &d) - 1u32).div_rem_floor(k);
+            if r != 0 || phi.is_odd() {
+                continue;
+            }
+
+            if let Some((p, q)) = trivial_factorization_with_n_phi(n, &phi) {
+                return Ok(Solution::new_pk(
+                    self.name(),
+                    PrivateKey::from_p_q(p, q, e.clone())?,
+                ));
             }
         }
         Err(Error::NotFound)
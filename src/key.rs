@@ -1,10 +1,11 @@
 use openssl::rsa::RsaPrivateKeyBuilder;
 use rug::{
     integer::{IsPrime, Order},
+    ops::Pow,
     Integer,
 };
 
-use crate::factors::Factors;
+use crate::{factors::Factors, ntheory::crt};
 
 /// Attack error
 #[derive(thiserror::Error, Debug, Clone, PartialEq, Eq)]
@@ -59,8 +60,27 @@ impl PrivateKey {
     }
 
     /// Decrypt cipher message
+    ///
+    /// Exponentiates modulo each prime power of n with a reduced exponent,
+    /// then recombines the results using the CRT.
     pub fn decrypt(&self, c: &Integer) -> Integer {
-        c.clone().pow_mod(&self.d, &self.n).unwrap()
+        let mut residues = Vec::with_capacity(self.factors.0.len());
+        let mut moduli = Vec::with_capacity(self.factors.0.len());
+        for (p, &k) in self.factors.0.iter() {
+            let pk = p.clone().pow(k as u32);
+            let d = if c.is_divisible(p) {
+                // Euler's theorem does not apply, keep the full exponent
+                self.d.clone()
+            } else {
+                let phi = Integer::from(p - 1u32) * p.clone().pow(k as u32 - 1);
+                Integer::from(&self.d % &phi)
+            };
+            residues.push(Integer::from(c.pow_mod_ref(&d, &pk).unwrap()));
+            moduli.push(pk);
+        }
+
+        crt(&residues, &moduli)
+            .unwrap_or_else(|| Integer::from(c.pow_mod_ref(&self.d, &self.n).unwrap()))
     }
 
     /// Returns P factor
@@ -137,3 +157,37 @@ impl PrivateKey {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn decrypt() {
+        let pk = PrivateKey::from_p_q(61.into(), 53.into(), 17.into()).unwrap();
+        let m = Integer::from(65);
+        let c = m.clone().pow_mod(&pk.e, &pk.n).unwrap();
+
+        assert_eq!(pk.decrypt(&c), m);
+    }
+
+    #[test]
+    fn decrypt_many_factors() {
+        let pk = PrivateKey::from_factors(
+            vec![
+                Integer::from(11),
+                Integer::from(11),
+                Integer::from(13),
+                Integer::from(17),
+            ],
+            7.into(),
+        )
+        .unwrap();
+
+        // Including ciphers sharing a factor with n
+        for c in 0..pk.n.to_u32().unwrap() {
+            let c = Integer::from(c);
+            assert_eq!(pk.decrypt(&c), c.clone().pow_mod(&pk.d, &pk.n).unwrap());
+        }
+    }
+}
@@ -5,7 +5,7 @@
 #![allow(clippy::assigning_clones)]
 
 use indicatif::{MultiProgress, ProgressBar, ProgressStyle};
-use rug::integer::IsPrime;
+use rug::integer::{IsPrime, Order};
 use rug::Integer;
 use std::cell::RefCell;
 #[cfg(feature = "parallel")]
@@ -29,7 +29,10 @@ pub use solution::*;
 
 /// Convert a `rug::Integer` to a byte vector.
 pub fn integer_to_bytes(i: &Integer) -> Vec<u8> {
-    base_x::decode("0123456789", &i.to_string()).unwrap()
+    if *i == 0 {
+        return vec![0];
+    }
+    i.to_digits(Order::Msf)
 }
 
 /// Convert a `rug::Integer` to a string.
@@ -39,7 +42,7 @@ pub fn integer_to_string(i: &Integer) -> Option<String> {
 
 /// Convert a byte vector to a `rug::Integer`.
 pub fn bytes_to_integer(bytes: &[u8]) -> Integer {
-    Integer::from_str_radix(&base_x::encode("0123456789", bytes), 10).unwrap()
+    Integer::from_digits(bytes, Order::Msf)
 }
 
 /// Convert a string to a `rug::Integer`.
@@ -311,6 +314,17 @@ mod tests {
 
     use super::*;
 
+    #[test]
+    fn integer_bytes() {
+        assert_eq!(integer_to_bytes(&Integer::ZERO), vec![0]);
+        assert_eq!(integer_to_bytes(&Integer::from(0x1234)), vec![0x12, 0x34]);
+        assert_eq!(bytes_to_integer(&[0, 0x12, 0x34]), 0x1234);
+        assert_eq!(
+            integer_to_string(&string_to_integer("RsaCracker")).unwrap(),
+            "RsaCracker"
+        );
+    }
+
     #[test]
     fn small_n_prime() {
         let params = Parameters {
@@ -10,7 +10,7 @@ use rug::{
 };
 use std::{sync::Arc, time::Duration};
 
-use rsacracker::{integer_to_bytes, integer_to_string, Attack, Parameters, ATTACKS};
+use rsacracker::{integer_to_bytes, Attack, Parameters, ATTACKS};
 use update_informer::{registry, Check};
 
 #[derive(Debug, Clone)]
@@ -156,13 +156,10 @@ struct Args {
 fn display_unciphered_data(uncipher: &Integer) {
     println!("Int = {uncipher}");
     println!("Hex = 0x{uncipher:02x}");
-    if let Some(str) = integer_to_string(uncipher) {
-        println!("String = \"{str}\"");
-    } else {
-        println!(
-            "Bytes = b\"{}\"",
-            display_bytes(&integer_to_bytes(uncipher))
-        );
+    // Convert once, falling back to the raw bytes if they are not UTF-8
+    match String::from_utf8(integer_to_bytes(uncipher)) {
+        Ok(str) => println!("String = \"{str}\""),
+        Err(err) => println!("Bytes = b\"{}\"", display_bytes(err.as_bytes())),
     }
 }
 
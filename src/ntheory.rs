@@ -1,73 +1,95 @@
-use rug::{
-    ops::{DivRounding, Pow},
-    Integer,
-};
-
-pub fn rational_to_contfrac(x: &Integer, y: &Integer) -> Vec<Integer> {
-    let a = x.clone().div_floor(y);
-
-    if a.clone() * y == *x {
-        vec![a]
-    } else {
-        let mut pquotients = rational_to_contfrac(y, &(x - a.clone() * y));
-        pquotients.insert(0, a);
-        pquotients
-    }
-}
+use rug::{ops::Pow, Integer};
 
-pub fn contfrac_to_rational(frac: &[Integer]) -> (Integer, Integer) {
-    if frac.is_empty() {
-        (0.into(), 1.into())
-    } else if frac.len() == 1 {
-        (frac[0].clone(), 1.into())
-    } else {
-        let remainder = frac[1..frac.len()].to_vec();
-        let (num, denom) = contfrac_to_rational(&remainder);
-        (frac[0].clone() * num.clone() + denom, num)
-    }
-}
+pub fn rational_convergents(x: &Integer, y: &Integer) -> impl Iterator<Item = (Integer, Integer)> {
+    let mut x = x.clone();
+    let mut y = y.clone();
+    let (mut h0, mut h1) = (Integer::ZERO, Integer::from(1));
+    let (mut k0, mut k1) = (Integer::from(1), Integer::ZERO);
 
-#[allow(dead_code)]
-pub fn convergents_from_contfrac(frac: &[Integer]) -> Vec<(Integer, Integer)> {
-    let mut convs = Vec::new();
+    // Euclidean algorithm fused with the convergents recurrence
+    std::iter::from_fn(move || {
+        if y == 0 {
+            return None;
+        }
 
-    for i in 0..frac.len() {
-        convs.push(contfrac_to_rational(&frac[0..i]));
-    }
-    convs
+        let (a, r) = <(Integer, Integer)>::from(x.div_rem_floor_ref(&y));
+        x = std::mem::replace(&mut y, r);
+        let h = Integer::from(&a * &h1) + &h0;
+        let k = a * &k1 + &k0;
+        h0 = std::mem::replace(&mut h1, h.clone());
+        k0 = std::mem::replace(&mut k1, k.clone());
+        Some((h, k))
+    })
 }
 
 pub fn trivial_factorization_with_n_phi(n: &Integer, phi: &Integer) -> Option<(Integer, Integer)> {
-    let m = n.clone() - phi.clone() + Integer::from(1);
-    let m2n2 = m.clone().pow(2) - Integer::from(n << 2);
+    // p and q are the roots of x^2 - (n - phi + 1) * x + n
+    let s = Integer::from(1) + n - phi;
+    let d = s.clone().pow(2) - n * Integer::from(4);
+    if d <= 0 || !d.is_perfect_square() {
+        return None;
+    }
 
-    if m2n2 > 0 {
-        let (i, _) = m2n2.sqrt_rem(Integer::new());
-        let roots: (Integer, Integer) = ((m.clone() - i.clone()) >> 1, (m + i) >> 1);
+    let sqrt_d = d.sqrt();
+    let p: Integer = (s.clone() - &sqrt_d) >> 1;
+    let q: Integer = (s + sqrt_d) >> 1;
 
-        if roots.0.clone() * roots.1.clone() == *n {
-            return Some(roots);
-        }
+    // Check if p and q are factors of n
+    if p.clone() * &q != *n {
+        return None;
     }
-    None
+    Some((p, q))
 }
 
 pub fn crt(residues: &[Integer], modulli: &[Integer]) -> Option<Integer> {
-    let prod = modulli.iter().product::<Integer>();
-    let mut sum = Integer::ZERO;
+    let mut x = Integer::ZERO;
+    let mut prod = Integer::from(1);
 
+    // Garner's algorithm, lift the solution one modulus at a time.
+    // Moduli sharing a factor are merged when the residues agree on it.
     for (residue, modulus) in residues.iter().zip(modulli) {
-        let p = prod.clone() / modulus;
-        sum += residue * Integer::from(p.invert_ref(modulus)?) * p
+        if *modulus == 0 {
+            return None;
+        }
+
+        let g = Integer::from(prod.gcd_ref(modulus));
+        let diff = Integer::from(residue - &x);
+        if !diff.is_divisible(&g) {
+            return None;
+        }
+
+        let m = Integer::from(modulus / &g);
+        if m == 1 {
+            // Already implied by the previous congruences
+            continue;
+        }
+
+        let inv = (Integer::from(&prod / &g) % &m).invert(&m).ok()?;
+        let mut t = diff / &g * inv % &m;
+        if t < 0 {
+            t += &m;
+        }
+        x += t * &prod;
+        prod *= m;
     }
 
-    Some(sum % prod)
+    Some(x)
 }
 
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn convergents() {
+        let expected = [(3, 1), (13, 4), (159, 49), (649, 200)]
+            .map(|(h, k)| (Integer::from(h), Integer::from(k)));
+
+        assert!(rational_convergents(&649.into(), &200.into()).eq(expected));
+        assert_eq!(rational_convergents(&0.into(), &7.into()).count(), 1);
+        assert_eq!(rational_convergents(&7.into(), &0.into()).count(), 0);
+    }
+
     #[test]
     fn chinese_remainder_theorem() {
         assert_eq!(
@@ -98,5 +120,16 @@ mod tests {
             ),
             None
         );
+        assert_eq!(
+            crt(&[2.into(), 5.into()], &[6.into(), 9.into()]),
+            Some(Integer::from(14))
+        );
+        assert_eq!(
+            crt(
+                &[2.into(), 5.into(), 11.into()],
+                &[6.into(), 9.into(), 15.into()]
+            ),
+            Some(Integer::from(86))
+        );
     }
 }
@@ -6,6 +6,12 @@ pub fn log_base_ceil(n: &Integer, base: usize) -> usize {
         return 0;
     }
 
+    // Power of two bases can be read from the bit length
+    if base > 1 && base.is_power_of_two() {
+        let bits = Integer::from(n - 1u32).significant_bits() as usize;
+        return bits.div_ceil(base.trailing_zeros() as usize);
+    }
+
     let mut result = 0;
     let mut num = n.clone() - 1;
 
@@ -35,3 +41,20 @@ pub fn solve_quadratic(a: &Integer, b: &Integer, c: &Integer) -> Vec<Integer> {
         _ => vec![],
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn log_base() {
+        assert_eq!(log_base_ceil(&1.into(), 2), 0);
+        assert_eq!(log_base_ceil(&2.into(), 2), 1);
+        assert_eq!(log_base_ceil(&1024.into(), 2), 10);
+        assert_eq!(log_base_ceil(&1025.into(), 2), 11);
+        assert_eq!(log_base_ceil(&4096.into(), 16), 3);
+        assert_eq!(log_base_ceil(&4097.into(), 16), 4);
+        assert_eq!(log_base_ceil(&1000.into(), 10), 3);
+        assert_eq!(log_base_ceil(&1001.into(), 10), 4);
+    }
+}